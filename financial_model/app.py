@@ -11,12 +11,17 @@ Design Principles:
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
+import numpy as np
 import sys
 import os
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# plotly is imported inside the chart builders so the header and story
+# cards render before that import is paid on a cold start.
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,39 +31,43 @@ from data.budget_2026 import (
     TOTAL_INFLOWS,
     TOTAL_EXPENSES,
     PROJECTED_SURPLUS,
-    EXCHANGE_RATE,
-    MONTHLY_INFLOWS,
-    MONTHLY_EXPENSES,
-    MONTHLY_CASH_POSITION,
-    GRANT_INCOME,
-    TOTAL_GRANT_INCOME,
-    PARTNER_REVENUE,
-    HEADCOUNT,
-    UNIT_ECONOMICS,
-    NIETE_ICT_CONTRACT,
-    FUNDRAISING_PIPELINE,
-    FUNDRAISING_TARGET,
-    BANK_BALANCES,
-    EXPENSES,
-    NON_SALARY_BREAKDOWN,
-    SUBSCRIPTIONS,
-    AI_BUILT_PRODUCTS,
+    CURRENT_STUDENTS,
     AI_ROI,
 )
-from models.cashflow_model import CashFlowModel
-from models.scenario_model import ScenarioModel, ScenarioType
+from models.scenario_model import ScenarioModel
 from models.sensitivity_model import SensitivityModel
-
-# Page config - wide but clean
-st.set_page_config(
-    page_title="Taleemabad 2026 Budget",
-    page_icon="💰",
-    layout="wide",
-    initial_sidebar_state="collapsed",  # Start collapsed for focus
+from utils.display import (
+    format_currency,
+    CASHFLOW_MONTHS,
+    CASHFLOW_NET,
+    MONTHLY_BURN,
+    RUNWAY_MONTHS,
+    RUNWAY_COLOR,
+    AVG_COST_PER_CHILD,
+    COST_COLOR,
+    FUNDER_NAMES,
+    FUNDER_AMOUNTS,
+    TOP_GRANT_PCT,
+    RISK_COLOR,
+    TOP_FUNDER_TEXT,
+    SURPLUS_STATUS_CLASS,
+    SURPLUS_STATUS_TEXT,
+    BUDGET_FLOW_TEXT,
+    TOP_2_TEXT,
+    GRANT_SUMMARY_HTML,
+    EXPENSE_SIMPLE_LABELS,
+    EXPENSE_SIMPLE_VALUES,
+    TOP_NON_SALARY_MD,
+    HEAD_OFFICE_MD,
+    PROGRAMS_MD,
+    SCALING_MD,
+    BIG_INFLOW_TEXT,
+    EFFICIENCY_PROGRAMS,
+    AI_TEAM_PRODUCTS,
 )
 
 # Minimalist CSS
-st.markdown("""
+_INLINE_CSS = """
 <style>
     /* Clean, minimal aesthetic */
     .main > div { padding-top: 2rem; }
@@ -89,6 +98,18 @@ st.markdown("""
         margin: 1rem 0;
     }
 
+    /* Static stat stack (one element instead of several st.metric) */
+    .stat-value {
+        font-size: 1.75rem;
+        font-weight: 600;
+        margin: 0 0 0.75rem 0;
+    }
+    .stat-label {
+        font-size: 0.75rem;
+        color: #6B7280;
+        margin: 0;
+    }
+
     /* Reduce metric clutter */
     [data-testid="stMetric"] {
         background: transparent;
@@ -134,18 +155,271 @@ st.markdown("""
         font-weight: 500;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Page config - wide but clean
+st.set_page_config(
+    page_title="Taleemabad 2026 Budget",
+    page_icon="💰",
+    layout="wide",
+    initial_sidebar_state="collapsed",  # Start collapsed for focus
+)
+
+# Minimalist CSS
+st.markdown(_INLINE_CSS, unsafe_allow_html=True)
+
+# Summary charts have nothing to hover, zoom or pan; only the cash flow
+# story chart keeps Plotly's interactivity.
+STATIC_CHART_CONFIG = {"staticPlot": True, "displayModeBar": False}
+
+# Every "Show details" flag starts closed; seeded once per session
+_SESSION_DEFAULTS = {
+    f"exp_{key}_opened": False
+    for key in ("grants", "expenses", "efficiency", "ai_roi", "whatif", "risks")
+}
+if "_initialized" not in st.session_state:
+    for _key, _value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(_key, _value)
+    st.session_state._initialized = True
+
+
+# =============================================================================
+# CACHED BUILDERS — inputs are budget constants, so reruns reuse the results
+# =============================================================================
+@st.cache_resource
+def get_models() -> dict:
+    """Shared model instances, built once per server process."""
+    scenario_model = ScenarioModel()
+    scenario_model.run_all_scenarios()
+    return {"sens": SensitivityModel(), "scn": scenario_model}
+
+
+@st.cache_data(show_spinner=False)
+def get_scenario_comparison() -> dict:
+    """Base/Optimistic/Pessimistic comparison as a plain dict."""
+    return get_models()["scn"].compare_scenarios()
+
+
+@st.cache_data(show_spinner=False)
+def _break_evens() -> tuple:
+    """Revenue and expense break-even percentages (two-point linear solve per variable)."""
+    sm = get_models()["sens"]
+    return sm.find_break_even_point('revenue'), sm.find_break_even_point('expenses')
+
+
+@st.cache_data(show_spinner=False)
+def _audit_summary(ts: str) -> bytes:
+    """Export summary file contents, rebuilt only when the date changes."""
+    return f"""
+Taleemabad 2026 Budget Summary
+Generated: {ts}
+
+KEY NUMBERS
+- Opening Balance: {format_currency(OPENING_BALANCE, False)}
+- Total Inflows: {format_currency(TOTAL_INFLOWS, False)}
+- Total Expenses: {format_currency(TOTAL_EXPENSES, False)}
+- Year-End Surplus: {format_currency(PROJECTED_SURPLUS, False)}
+- Runway: {RUNWAY_MONTHS:.1f} months
+
+RISK FACTORS
+- Top funder concentration: {TOP_GRANT_PCT:.0f}%
+- Grant diversification needed
+
+EFFICIENCY
+- Avg cost per child: ${AVG_COST_PER_CHILD:.2f}/year
+- Students reached: {CURRENT_STUDENTS:,}
+
+AI INVESTMENT ROI
+- Annual AI spend: ${AI_ROI['annual_ai_spend']:,}
+- AI cost per employee: ${AI_ROI['ai_cost_per_employee']}/year
+- ROI: {AI_ROI['benefits_to_cost_ratio']}x
+- Virtual FTEs added: {AI_ROI['virtual_ftes_added']}
+- Estimated savings: ${AI_ROI['estimated_savings_low']:,}-${AI_ROI['estimated_savings_high']:,}/year
+""".encode()
+
+
+def _open_details(flag: str) -> None:
+    """Button callback: mark a details section as opened."""
+    st.session_state[flag] = True
+
+
+def details_opened(key: str) -> bool:
+    """
+    Whether the user has opened a details section yet.
+
+    Expander bodies run on every rerun even while collapsed, so the chart
+    work inside each one waits behind a one-time "Show details" click.
+    """
+    flag = f"exp_{key}_opened"
+    if not st.session_state[flag]:
+        # The callback runs before the rerun, so the button is gone once open
+        st.button("Show details", key=f"{flag}_btn",
+                  on_click=_open_details, args=(flag,))
+    return st.session_state[flag]
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_cashflow_fig(months: tuple, net: np.ndarray, opening_balance: float) -> "go.Figure":
+    """Cumulative cash position area chart with the safety threshold."""
+    import plotly.graph_objects as go
+
+    cash = opening_balance + np.cumsum(net)
+
+    # Simple area chart - the story: cash position line
+    fig = go.Figure(
+        go.Scatter(
+            x=months,
+            y=cash,
+            fill="tozeroy",
+            mode="lines+markers",
+            name="Cash Position",
+            line=dict(color="#3B82F6", width=3),
+            fillcolor="rgba(59, 130, 246, 0.15)",
+            hovertemplate="<b>%{x}</b><br>Cash: $%{y:,.0f}<extra></extra>"
+        ),
+        layout=dict(
+            height=350,
+            margin=dict(l=0, r=0, t=20, b=0),
+            showlegend=False,
+            yaxis=dict(tickformat="$,.0f"),
+            hovermode="x unified",
+        ),
+    )
+
+    # Safety threshold
+    fig.add_hline(y=500000, line_dash="dash", line_color="#EF4444",
+                  annotation_text="$500K safety threshold",
+                  annotation_position="top left")
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def build_grant_fig() -> "go.Figure":
+    """Horizontal bar of grant amounts, smallest first."""
+    import plotly.graph_objects as go
+
+    order = np.argsort(FUNDER_AMOUNTS, kind="stable")
+    amounts = FUNDER_AMOUNTS[order]
+
+    return go.Figure(
+        go.Bar(
+            y=FUNDER_NAMES[order],
+            x=amounts,
+            orientation="h",
+            text=amounts,
+            texttemplate="%{x:$,.0f}",
+            textposition="outside",
+            marker_color="#3B82F6",
+        ),
+        layout=dict(height=300, margin=dict(l=0, r=0, t=0, b=0), showlegend=False),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def build_expense_pie() -> "go.Figure":
+    """Donut of head office vs program spend."""
+    import plotly.graph_objects as go
+
+    return go.Figure(
+        go.Pie(
+            labels=EXPENSE_SIMPLE_LABELS,
+            values=EXPENSE_SIMPLE_VALUES,
+            hole=0.6,
+            marker=dict(colors=["#3B82F6", "#10B981"]),
+            textinfo="percent+label",
+        ),
+        layout=dict(height=250, margin=dict(l=0, r=0, t=0, b=0), showlegend=True,
+                    legend=dict(orientation="h", yanchor="bottom", y=-0.2)),
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_efficiency_fig(programs: tuple) -> "go.Figure":
+    """Cost per child bars; `programs` is a tuple of (program, cost_per_child, students)."""
+    import plotly.graph_objects as go
+
+    names = [name for name, _, _ in programs]
+    costs = [cost for _, cost, _ in programs]
+
+    vals = np.asarray(costs, dtype=np.float64)
+    colors = np.select([vals <= 5, vals <= 10], ["#10B981", "#F59E0B"], default="#EF4444").tolist()
+
+    fig = go.Figure(
+        go.Bar(
+            x=names,
+            y=costs,
+            text=costs,
+            texttemplate="$%{text:.2f}",
+            textposition="outside",
+            marker_color=colors,
+        ),
+        layout=dict(height=300, margin=dict(l=0, r=40, t=20, b=0), showlegend=False,
+                    yaxis=dict(range=[0, 18], title="$/child/year")),
+    )
+    fig.add_hline(y=5, line_dash="dash", line_color="#EF4444",
+                 annotation_text="$5 target", annotation_position="top right")
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_ai_team_fig(products: tuple) -> "go.Figure":
+    """Actual vs traditional team size; `products` is a tuple of (name, team_size, traditional)."""
+    import plotly.graph_objects as go
+
+    names = [name for name, _, _ in products]
+
+    return go.Figure(
+        [
+            go.Bar(
+                name="Actual Team",
+                y=names,
+                x=[team_size for _, team_size, _ in products],
+                orientation="h",
+                text=[team_size for _, team_size, _ in products],
+                textposition="outside",
+                marker_color="#10B981",
+            ),
+            go.Bar(
+                name="Without AI",
+                y=names,
+                x=[traditional for _, _, traditional in products],
+                orientation="h",
+                text=[traditional for _, _, traditional in products],
+                textposition="outside",
+                marker_color="#E5E7EB",
+            ),
+        ],
+        layout=dict(
+            barmode="group",
+            height=250,
+            margin=dict(l=0, r=40, t=20, b=0),
+            showlegend=True,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            xaxis=dict(title="Team Size (people)"),
+        ),
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_scenario_fig(scenarios: tuple) -> "go.Figure":
+    """Year-end surplus per scenario; `scenarios` is a tuple of (name, surplus)."""
+    import plotly.graph_objects as go
 
-MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    names = [name for name, _ in scenarios]
+    surpluses = np.fromiter((surplus for _, surplus in scenarios), dtype=np.float64, count=len(scenarios))
+    colors = np.where(surpluses > 0, "#10B981", "#EF4444").tolist()
 
-def format_currency(value: float, compact: bool = True) -> str:
-    """Format as compact currency."""
-    if compact:
-        if value >= 1_000_000:
-            return f"${value/1_000_000:.1f}M"
-        elif value >= 1_000:
-            return f"${value/1_000:.0f}K"
-    return f"${value:,.0f}"
+    return go.Figure(
+        go.Bar(
+            x=names,
+            y=surpluses,
+            text=surpluses,
+            texttemplate="%{text:$,.0f}",
+            textposition="outside",
+            marker_color=colors,
+        ),
+        layout=dict(height=250, margin=dict(l=0, r=0, t=0, b=0), showlegend=False),
+    )
 
 
 # =============================================================================
@@ -154,10 +428,6 @@ def format_currency(value: float, compact: bool = True) -> str:
 st.markdown("# Taleemabad 2026 Budget")
 
 # The ONE thing you need to know
-surplus_status = "healthy" if PROJECTED_SURPLUS > 500000 else ("warning" if PROJECTED_SURPLUS > 0 else "danger")
-status_class = f"status-{surplus_status}"
-status_text = "Healthy" if surplus_status == "healthy" else ("Caution" if surplus_status == "warning" else "At Risk")
-
 col1, col2 = st.columns([3, 1])
 with col1:
     st.markdown(f"""
@@ -166,11 +436,11 @@ with col1:
     """, unsafe_allow_html=True)
 with col2:
     st.markdown(f"""
-    <span class="{status_class}">{status_text}</span>
+    <span class="{SURPLUS_STATUS_CLASS}">{SURPLUS_STATUS_TEXT}</span>
     """, unsafe_allow_html=True)
 
 # One-line summary
-st.caption(f"Starting with {format_currency(OPENING_BALANCE)} → Receiving {format_currency(TOTAL_INFLOWS)} → Spending {format_currency(TOTAL_EXPENSES)} → Ending with {format_currency(OPENING_BALANCE + PROJECTED_SURPLUS)}")
+st.caption(BUDGET_FLOW_TEXT)
 
 st.markdown("---")
 
@@ -179,47 +449,29 @@ st.markdown("---")
 # =============================================================================
 c1, c2, c3 = st.columns(3)
 
-# Initialize models
-model = CashFlowModel()
-sensitivity_model = SensitivityModel()
-grant_analysis = sensitivity_model.analyze_grant_dependency()
-
-# Calculate key insights
-avg_burn = model.get_average_monthly_burn()
-runway_months = PROJECTED_SURPLUS / avg_burn if avg_burn > 0 else 0
-top_grant_pct = max(g["amount"] for g in GRANT_INCOME.values()) / TOTAL_GRANT_INCOME * 100
-current_students = sum(p.get("students", 0) for p in UNIT_ECONOMICS.values())
-
 with c1:
     st.markdown("### 💰 Cash Position")
-    runway_color = "hero-green" if runway_months >= 6 else ("hero-amber" if runway_months >= 3 else "hero-red")
     st.markdown(f"""
-    <p class="hero-number {runway_color}">{runway_months:.1f}</p>
+    <p class="hero-number {RUNWAY_COLOR}">{RUNWAY_MONTHS:.1f}</p>
     <p class="hero-label">MONTHS RUNWAY</p>
     """, unsafe_allow_html=True)
-    st.caption(f"After 2026 ends, at {format_currency(avg_burn)}/month burn rate")
+    st.caption(f"After 2026 ends, at {format_currency(MONTHLY_BURN)}/month burn rate")
 
 with c2:
     st.markdown("### ⚠️ Risk Level")
-    risk_color = "hero-red" if top_grant_pct > 35 else ("hero-amber" if top_grant_pct > 25 else "hero-green")
     st.markdown(f"""
-    <p class="hero-number {risk_color}">{top_grant_pct:.0f}%</p>
+    <p class="hero-number {RISK_COLOR}">{TOP_GRANT_PCT:.0f}%</p>
     <p class="hero-label">TOP FUNDER SHARE</p>
     """, unsafe_allow_html=True)
-    st.caption(f"Mulago = {format_currency(GRANT_INCOME['mulago']['amount'])} of {format_currency(TOTAL_GRANT_INCOME)}")
+    st.caption(TOP_FUNDER_TEXT)
 
 with c3:
     st.markdown("### 📊 Efficiency")
-    avg_cost = (
-        UNIT_ECONOMICS["niete_ict"]["students"] * UNIT_ECONOMICS["niete_ict"]["cost_per_child"] +
-        UNIT_ECONOMICS["prevail_rawalpindi"]["students"] * UNIT_ECONOMICS["prevail_rawalpindi"]["cost_per_child"]
-    ) / current_students if current_students > 0 else 0
-    cost_color = "hero-green" if avg_cost <= 5 else ("hero-amber" if avg_cost <= 10 else "hero-red")
     st.markdown(f"""
-    <p class="hero-number {cost_color}">${avg_cost:.2f}</p>
+    <p class="hero-number {COST_COLOR}">${AVG_COST_PER_CHILD:.2f}</p>
     <p class="hero-label">COST PER CHILD/YEAR</p>
     """, unsafe_allow_html=True)
-    st.caption(f"Reaching {current_students:,} students across programs")
+    st.caption(f"Reaching {CURRENT_STUDENTS:,} students across programs")
 
 st.markdown("---")
 
@@ -229,57 +481,21 @@ st.markdown("---")
 st.markdown("### Cash Flow Story")
 st.caption("How money flows through 2026")
 
-# Build cumulative cash position
-positions = []
-cumulative = OPENING_BALANCE
-for month in MONTHS:
-    net = MONTHLY_INFLOWS[month] - MONTHLY_EXPENSES[month]
-    cumulative += net
-    positions.append({
-        "Month": month,
-        "Cash Position": cumulative,
-        "Net Flow": net,
-    })
-
-df = pd.DataFrame(positions)
-
-# Simple area chart - the story
-fig = go.Figure()
-
-# Cash position line
-fig.add_trace(go.Scatter(
-    x=df["Month"],
-    y=df["Cash Position"],
-    fill="tozeroy",
-    mode="lines+markers",
-    name="Cash Position",
-    line=dict(color="#3B82F6", width=3),
-    fillcolor="rgba(59, 130, 246, 0.15)",
-    hovertemplate="<b>%{x}</b><br>Cash: $%{y:,.0f}<extra></extra>"
-))
-
-# Safety threshold
-fig.add_hline(y=500000, line_dash="dash", line_color="#EF4444",
-              annotation_text="$500K safety threshold",
-              annotation_position="top left")
-
-fig.update_layout(
-    height=350,
-    margin=dict(l=0, r=0, t=20, b=0),
-    yaxis_title=None,
-    xaxis_title=None,
-    showlegend=False,
-    yaxis=dict(tickformat="$,.0f"),
-    hovermode="x unified",
-)
-
-st.plotly_chart(fig, use_container_width=True)
+# A cache_data hit still unpickles a fresh figure, so the session keeps
+# the built figure and only asks for a new one when the inputs change.
+cashflow_key = hash((OPENING_BALANCE, CASHFLOW_NET.tobytes()))
+if st.session_state.get("_cashflow_fig_key") != cashflow_key:
+    st.session_state["_cashflow_fig"] = build_cashflow_fig(
+        CASHFLOW_MONTHS,
+        CASHFLOW_NET,
+        OPENING_BALANCE,
+    )
+    st.session_state["_cashflow_fig_key"] = cashflow_key
+st.plotly_chart(st.session_state["_cashflow_fig"], use_container_width=True, key="cashflow_chart")
 
 # Key insight below chart
-big_months = [(m, MONTHLY_INFLOWS[m]) for m in MONTHS if MONTHLY_INFLOWS[m] > 500000]
-if big_months:
-    big_months_text = ", ".join([f"**{m}** ({format_currency(v)})" for m, v in sorted(big_months, key=lambda x: -x[1])[:3]])
-    st.info(f"📅 **Big inflow months:** {big_months_text} — these are when major grants land")
+if BIG_INFLOW_TEXT:
+    st.info(f"📅 **Big inflow months:** {BIG_INFLOW_TEXT} — these are when major grants land")
 
 st.markdown("---")
 
@@ -289,209 +505,171 @@ st.markdown("---")
 st.markdown("### Details")
 
 # TAB 1: Where money comes from
+@st.fragment
+def grants_details():
+    """Grant chart and funding summary."""
+    if details_opened("grants"):
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.plotly_chart(build_grant_fig(), use_container_width=True, config=STATIC_CHART_CONFIG, key="grant_chart")
+
+        with col2:
+            st.markdown("**Summary**")
+            st.markdown(GRANT_SUMMARY_HTML, unsafe_allow_html=True)
+
+            st.markdown("---")
+            st.markdown("**⚠️ Concentration Risk**")
+            st.write(TOP_2_TEXT)
+            st.caption("Target: No funder > 25%")
+
+
 with st.expander("💵 **Where the Money Comes From** — Grant breakdown", expanded=False):
-    col1, col2 = st.columns([2, 1])
-
-    with col1:
-        grant_data = pd.DataFrame([
-            {"Funder": k.replace("_", " ").title(), "Amount": v["amount"]}
-            for k, v in GRANT_INCOME.items()
-        ]).sort_values("Amount", ascending=True)
-
-        fig = px.bar(
-            grant_data,
-            y="Funder",
-            x="Amount",
-            orientation="h",
-            text="Amount",
-            color_discrete_sequence=["#3B82F6"]
-        )
-        fig.update_traces(texttemplate="%{x:$,.0f}", textposition="outside")
-        fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0), showlegend=False, yaxis_title=None, xaxis_title=None)
-        st.plotly_chart(fig, use_container_width=True)
-
-    with col2:
-        st.markdown("**Summary**")
-        st.metric("Total Grants", format_currency(TOTAL_GRANT_INCOME))
-        st.metric("Total Partners", format_currency(sum(p["annual_total"] for p in PARTNER_REVENUE.values())))
-        st.metric("# of Funders", len(GRANT_INCOME))
-
-        st.markdown("---")
-        st.markdown("**⚠️ Concentration Risk**")
-        top_2 = GRANT_INCOME["mulago"]["amount"] + sum(
-            GRANT_INCOME[k]["amount"] for k in ["prevail_general_ops", "prevail_implementation", "prevail_data_collection"]
-        )
-        st.write(f"Top 2 funders = **{top_2/TOTAL_GRANT_INCOME*100:.0f}%** of grants")
-        st.caption("Target: No funder > 25%")
+    grants_details()
 
 # TAB 2: Where money goes
+@st.fragment
+def expenses_details():
+    """Expense split and line-item breakdown."""
+    if details_opened("expenses"):
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            st.markdown("**By Category**")
+            st.plotly_chart(build_expense_pie(), use_container_width=True, config=STATIC_CHART_CONFIG, key="expense_chart")
+
+        with col2:
+            st.markdown("**Head Office Breakdown** ($1.69M)")
+            st.markdown(HEAD_OFFICE_MD)
+
+            st.markdown("**Non-Salary Top Items:**")
+            st.markdown(TOP_NON_SALARY_MD)
+
+            st.markdown("---")
+            st.markdown("**Programs Breakdown** ($874K)")
+            st.markdown(PROGRAMS_MD)
+
+
 with st.expander("💸 **Where the Money Goes** — Expense breakdown", expanded=False):
-    col1, col2 = st.columns([1, 1])
-
-    with col1:
-        st.markdown("**By Category**")
-        expense_simple = pd.DataFrame([
-            {"Category": "Head Office", "Amount": EXPENSES["subtotal_head_office"], "Pct": EXPENSES["subtotal_head_office"]/TOTAL_EXPENSES*100},
-            {"Category": "Programs", "Amount": EXPENSES["program_operations"], "Pct": EXPENSES["program_operations"]/TOTAL_EXPENSES*100},
-        ])
-
-        fig = px.pie(expense_simple, values="Amount", names="Category", hole=0.6,
-                     color_discrete_sequence=["#3B82F6", "#10B981"])
-        fig.update_layout(height=250, margin=dict(l=0, r=0, t=0, b=0), showlegend=True,
-                         legend=dict(orientation="h", yanchor="bottom", y=-0.2))
-        fig.update_traces(textinfo="percent+label")
-        st.plotly_chart(fig, use_container_width=True)
-
-    with col2:
-        st.markdown("**Head Office Breakdown** ($1.69M)")
-        st.write(f"- Salaries: **{format_currency(EXPENSES['salaries_development_teams'])}** (70%)")
-        st.write(f"- Non-Salary: **{format_currency(EXPENSES['non_salary_expenses'])}** (30%)")
-
-        st.markdown("**Non-Salary Top Items:**")
-        top_non_salary = sorted(NON_SALARY_BREAKDOWN.items(), key=lambda x: -x[1])[:3]
-        for name, amount in top_non_salary:
-            st.write(f"  • {name.replace('_', ' ').title()}: {format_currency(amount)}")
-
-        st.markdown("---")
-        st.markdown("**Programs Breakdown** ($874K)")
-        st.write(f"- NIETE ICT: {format_currency(EXPENSES['niete_ict'])} (90K students)")
-        st.write(f"- Rawalpindi: {format_currency(EXPENSES['prevail_rawalpindi'])} (37K students)")
-        st.write(f"- Other: {format_currency(EXPENSES['programs_other'])}")
+    expenses_details()
 
 # TAB 3: Program efficiency
+@st.fragment
+def efficiency_details():
+    """Cost per child comparison and scaling estimate."""
+    if details_opened("efficiency"):
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.plotly_chart(build_efficiency_fig(EFFICIENCY_PROGRAMS), use_container_width=True,
+                            config=STATIC_CHART_CONFIG, key="efficiency_chart")
+
+        with col2:
+            st.markdown("**Key Insight**")
+            st.success("""
+            Rawalpindi is **3× more efficient** than NIETE ICT
+
+            **Why?**
+            - No $574K fixed costs
+            - Lean staffing (6 vs 71)
+            - Grant vs contract model
+            """)
+
+            st.markdown("---")
+            st.markdown("**Scaling Implications**")
+            st.markdown(SCALING_MD)
+
+
 with st.expander("📊 **Program Efficiency** — Cost per child comparison", expanded=False):
-    col1, col2 = st.columns([2, 1])
-
-    with col1:
-        efficiency_data = pd.DataFrame([
-            {"Program": "Rawalpindi", "Cost/Child": UNIT_ECONOMICS["prevail_rawalpindi"]["cost_per_child"], "Students": 37000},
-            {"Program": "NIETE ICT (Variable)", "Cost/Child": UNIT_ECONOMICS["niete_ict"]["cost_per_child"], "Students": 90000},
-            {"Program": "NIETE ICT (Total)", "Cost/Child": UNIT_ECONOMICS["niete_ict"]["cost_per_child_total"], "Students": 90000},
-        ])
-
-        colors = ["#10B981" if c <= 5 else "#F59E0B" if c <= 10 else "#EF4444" for c in efficiency_data["Cost/Child"]]
-
-        fig = px.bar(efficiency_data, x="Program", y="Cost/Child", text="Cost/Child",
-                     color="Program", color_discrete_sequence=colors)
-        fig.add_hline(y=5, line_dash="dash", line_color="#EF4444",
-                     annotation_text="$5 target", annotation_position="top right")
-        fig.update_traces(texttemplate="$%{text:.2f}", textposition="outside")
-        fig.update_layout(height=300, margin=dict(l=0, r=40, t=20, b=0), showlegend=False,
-                         yaxis=dict(range=[0, 18]), yaxis_title="$/child/year")
-        st.plotly_chart(fig, use_container_width=True)
-
-    with col2:
-        st.markdown("**Key Insight**")
-        st.success("""
-        Rawalpindi is **3× more efficient** than NIETE ICT
-
-        **Why?**
-        - No $574K fixed costs
-        - Lean staffing (6 vs 71)
-        - Grant vs contract model
+    efficiency_details()
+
+# TAB 4: AI Investment ROI
+@st.fragment
+def ai_roi_details():
+    """AI team comparison and ROI metrics."""
+    if details_opened("ai_roi"):
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            # Team comparison chart
+            st.plotly_chart(build_ai_team_fig(AI_TEAM_PRODUCTS), use_container_width=True,
+                            config=STATIC_CHART_CONFIG, key="ai_team_chart")
+
+            st.caption("AI tools enable 6.5 people to do the work of 25 — a **3.8× multiplier**")
+
+        with col2:
+            st.markdown(f"""
+            <p class="hero-number hero-green">{AI_ROI['benefits_to_cost_ratio']}×</p>
+            <p class="hero-label">ROI ON AI SPEND</p>
+            """, unsafe_allow_html=True)
+
+            st.metric("AI Spend / Employee", f"${AI_ROI['ai_cost_per_employee']}/year",
+                      help=f"${AI_ROI['annual_ai_spend']:,} ÷ {AI_ROI['headcount_avg']} avg headcount")
+            st.metric("Virtual FTEs Added", f"+{AI_ROI['virtual_ftes_added']}",
+                      help="Equivalent full-time employees replaced by AI tools")
+            st.metric("Estimated Savings", f"${AI_ROI['estimated_savings_low']/1000:.0f}-{AI_ROI['estimated_savings_high']/1000:.0f}K/year")
+
+        st.success(f"""
+        **Key Insight:** Every $1 spent on AI tools saves $1.50-2.70 in equivalent labor costs.
+        At **${AI_ROI['ai_cost_per_employee']}/employee/year**, AI tools are the highest-ROI line item in the budget.
+
+        **Products built with AI:** Rumi (1,878 users, 40K+ conversations), Balochistan WSP (2,517 observations), SchoolPilot (232 schools)
         """)
 
-        st.markdown("---")
-        st.markdown("**Scaling Implications**")
-        add_100k = 100000 * UNIT_ECONOMICS["prevail_rawalpindi"]["cost_per_child"]
-        st.write(f"To reach +100K students:")
-        st.write(f"- At Rawalpindi rate: **{format_currency(add_100k)}/year**")
-        st.write(f"- At NIETE rate: **{format_currency(100000 * 10.62)}/year**")
 
-# TAB 4: AI Investment ROI
 with st.expander("🤖 **AI Investment ROI** — What $84K in AI tools delivers", expanded=False):
-    col1, col2 = st.columns([2, 1])
-
-    with col1:
-        # Team comparison chart
-        products = []
-        for key, prod in AI_BUILT_PRODUCTS.items():
-            products.append({"Product": prod["name"], "Type": "Actual Team", "People": prod["team_size"]})
-            products.append({"Product": prod["name"], "Type": "Without AI", "People": prod["traditional_team_estimate"]})
-
-        team_df = pd.DataFrame(products)
-
-        fig = px.bar(
-            team_df,
-            y="Product",
-            x="People",
-            color="Type",
-            barmode="group",
-            orientation="h",
-            text="People",
-            color_discrete_map={"Actual Team": "#10B981", "Without AI": "#E5E7EB"},
-        )
-        fig.update_traces(textposition="outside")
-        fig.update_layout(
-            height=250,
-            margin=dict(l=0, r=40, t=20, b=0),
-            showlegend=True,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            yaxis_title=None,
-            xaxis_title="Team Size (people)",
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.caption("AI tools enable 6.5 people to do the work of 25 — a **3.8× multiplier**")
-
-    with col2:
-        st.markdown(f"""
-        <p class="hero-number hero-green">{AI_ROI['benefits_to_cost_ratio']}×</p>
-        <p class="hero-label">ROI ON AI SPEND</p>
-        """, unsafe_allow_html=True)
-
-        st.metric("AI Spend / Employee", f"${AI_ROI['ai_cost_per_employee']}/year",
-                  help=f"${AI_ROI['annual_ai_spend']:,} ÷ {AI_ROI['headcount_avg']} avg headcount")
-        st.metric("Virtual FTEs Added", f"+{AI_ROI['virtual_ftes_added']}",
-                  help="Equivalent full-time employees replaced by AI tools")
-        st.metric("Estimated Savings", f"${AI_ROI['estimated_savings_low']/1000:.0f}-{AI_ROI['estimated_savings_high']/1000:.0f}K/year")
-
-    st.success(f"""
-    **Key Insight:** Every $1 spent on AI tools saves $1.50-2.70 in equivalent labor costs.
-    At **${AI_ROI['ai_cost_per_employee']}/employee/year**, AI tools are the highest-ROI line item in the budget.
-
-    **Products built with AI:** Rumi (1,878 users, 40K+ conversations), Balochistan WSP (2,517 observations), SchoolPilot (232 schools)
-    """)
+    ai_roi_details()
 
 # TAB 5: What-if scenarios
-with st.expander("🎯 **What-If Analysis** — Scenario planning", expanded=False):
-    scenario_model = ScenarioModel()
-    scenario_model.run_all_scenarios()
+@st.fragment
+def whatif_section():
+    """Custom scenario sliders; moving them reruns only this fragment."""
+    st.markdown("**Custom Scenario**")
+    revenue_mult = st.slider("Revenue", 0.5, 1.5, 1.0, 0.1, format="%.0f%%", key="rev_slider")
+    expense_mult = st.slider("Expenses", 0.5, 1.5, 1.0, 0.1, format="%.0f%%", key="exp_slider")
 
-    col1, col2 = st.columns([1, 1])
+    custom_surplus = PROJECTED_SURPLUS * revenue_mult / expense_mult
+    delta_pct = (custom_surplus / PROJECTED_SURPLUS - 1) * 100
 
-    with col1:
-        st.markdown("**Pre-built Scenarios**")
-        comparison = scenario_model.compare_scenarios()
+    st.metric("Custom Surplus", format_currency(custom_surplus),
+             delta=f"{delta_pct:+.0f}%" if delta_pct != 0 else None)
 
-        scenario_data = pd.DataFrame([
-            {"Scenario": s, "Surplus": comparison[s]["year_end_surplus"]}
-            for s in ["Base Case", "Optimistic", "Pessimistic"]
-        ])
+    if custom_surplus < 0:
+        st.error("⚠️ This scenario results in a deficit!")
 
-        colors = ["#10B981" if s > 0 else "#EF4444" for s in scenario_data["Surplus"]]
 
-        fig = px.bar(scenario_data, x="Scenario", y="Surplus", text="Surplus",
-                     color="Scenario", color_discrete_sequence=colors)
-        fig.update_traces(texttemplate="%{text:$,.0f}", textposition="outside")
-        fig.update_layout(height=250, margin=dict(l=0, r=0, t=0, b=0), showlegend=False, yaxis_title=None)
-        st.plotly_chart(fig, use_container_width=True)
-
-    with col2:
-        st.markdown("**Custom Scenario**")
-        revenue_mult = st.slider("Revenue", 0.5, 1.5, 1.0, 0.1, format="%.0f%%", key="rev_slider")
-        expense_mult = st.slider("Expenses", 0.5, 1.5, 1.0, 0.1, format="%.0f%%", key="exp_slider")
+with st.expander("🎯 **What-If Analysis** — Scenario planning", expanded=False):
+    if details_opened("whatif"):
+        col1, col2 = st.columns([1, 1])
 
-        custom_surplus = PROJECTED_SURPLUS * revenue_mult / expense_mult
-        delta_pct = (custom_surplus / PROJECTED_SURPLUS - 1) * 100
+        with col1:
+            st.markdown("**Pre-built Scenarios**")
+            comparison = get_scenario_comparison()
 
-        st.metric("Custom Surplus", format_currency(custom_surplus),
-                 delta=f"{delta_pct:+.0f}%" if delta_pct != 0 else None)
+            # Model names carry a suffix, e.g. "Base Case (Budget)"
+            scenarios = tuple(
+                (name.split(" (")[0], data["year_end_surplus"])
+                for name, data in comparison.items()
+            )
+            st.plotly_chart(build_scenario_fig(scenarios), use_container_width=True,
+                            config=STATIC_CHART_CONFIG, key="scenario_chart")
 
-        if custom_surplus < 0:
-            st.error("⚠️ This scenario results in a deficit!")
+        with col2:
+            whatif_section()
 
 # TAB 6: Key risks
+@st.fragment
+def break_even_details():
+    """Revenue and expense break-even metrics."""
+    if details_opened("risks"):
+        rev_break, exp_break = _break_evens()
+        be_col1, be_col2 = st.columns(2)
+        with be_col1:
+            st.metric("Revenue can drop by", f"{abs(rev_break):.0f}%", help="Before hitting zero surplus")
+        with be_col2:
+            st.metric("Expenses can rise by", f"{exp_break:.0f}%", help="Before hitting zero surplus")
+
+
 with st.expander("⚠️ **Key Risks** — What could go wrong", expanded=False):
     st.markdown("""
     | Risk | Impact | Mitigation |
@@ -505,13 +683,7 @@ with st.expander("⚠️ **Key Risks** — What could go wrong", expanded=False)
     st.markdown("---")
     st.markdown("**Break-Even Points**")
 
-    be_col1, be_col2 = st.columns(2)
-    with be_col1:
-        rev_break = sensitivity_model.find_break_even_point('revenue')
-        st.metric("Revenue can drop by", f"{abs(rev_break):.0f}%", help="Before hitting zero surplus")
-    with be_col2:
-        exp_break = sensitivity_model.find_break_even_point('expenses')
-        st.metric("Expenses can rise by", f"{exp_break:.0f}%", help="Before hitting zero surplus")
+    break_even_details()
 
 st.markdown("---")
 
@@ -522,33 +694,10 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Export button
-    audit_text = f"""
-Taleemabad 2026 Budget Summary
-Generated: {datetime.now().strftime('%Y-%m-%d')}
-
-KEY NUMBERS
-- Opening Balance: {format_currency(OPENING_BALANCE, False)}
-- Total Inflows: {format_currency(TOTAL_INFLOWS, False)}
-- Total Expenses: {format_currency(TOTAL_EXPENSES, False)}
-- Year-End Surplus: {format_currency(PROJECTED_SURPLUS, False)}
-- Runway: {runway_months:.1f} months
-
-RISK FACTORS
-- Top funder concentration: {top_grant_pct:.0f}%
-- Grant diversification needed
-
-EFFICIENCY
-- Avg cost per child: ${avg_cost:.2f}/year
-- Students reached: {current_students:,}
-
-AI INVESTMENT ROI
-- Annual AI spend: ${AI_ROI['annual_ai_spend']:,}
-- AI cost per employee: ${AI_ROI['ai_cost_per_employee']}/year
-- ROI: {AI_ROI['benefits_to_cost_ratio']}x
-- Virtual FTEs added: {AI_ROI['virtual_ftes_added']}
-- Estimated savings: ${AI_ROI['estimated_savings_low']:,}-${AI_ROI['estimated_savings_high']:,}/year
-"""
-    st.download_button("📥 Export Summary", audit_text, file_name="budget_summary.txt",
+    # Stamped once per session; reruns reuse the same date string
+    if "audit_ts" not in st.session_state:
+        st.session_state.audit_ts = datetime.now().strftime('%Y-%m-%d')
+    st.download_button("📥 Export Summary", _audit_summary(st.session_state.audit_ts), file_name="budget_summary.txt",
                        mime="text/plain", use_container_width=True)
 
 with col2:
@@ -4,39 +4,22 @@ Provides intelligent, context-aware assistance using Claude API.
 """
 
 import streamlit as st
-import anthropic
 import os
-from typing import List, Dict, Optional
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+# Older turns are dropped once the session history reaches this length
+MAX_CHAT_HISTORY = 50
 
-class FinancialChatbot:
-    """
-    AI-powered chatbot that helps users understand the financial dashboard.
-    Context-aware: knows which tab the user is on and their current data.
-    """
+# Answers kept per session for repeated questions (least recently used evicted)
+MAX_CACHED_RESPONSES = 64
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize chatbot with Claude API."""
-        self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
-        if self.api_key:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
-        else:
-            self.client = None
 
-    def get_system_context(self, current_tab: str, dashboard_data: Dict) -> str:
-        """
-        Build context about the dashboard state for Claude.
-        """
-        context = f"""You are a helpful financial analyst assistant embedded in Taleemabad's Financial Dashboard.
-
-CURRENT CONTEXT:
-- User is viewing: {current_tab}
-- Opening Balance: ${dashboard_data.get('opening_balance', 0):,.0f}
-- Year-End Projected Surplus: ${dashboard_data.get('projected_surplus', 0):,.0f}
-- Total Grants 2026: ${dashboard_data.get('total_grants', 0):,.0f}
-- Average Monthly Burn: ${dashboard_data.get('avg_burn', 0):,.0f}
-- Current Runway: {dashboard_data.get('runway_months', 0):.1f} months
+# Static part of the system prompt. It is sent first and marked for
+# Anthropic prompt caching, so only the small metrics block varies.
+SYSTEM_PROMPT = """You are a helpful financial analyst assistant embedded in Taleemabad's Financial Dashboard.
 
 KEY PROGRAMS:
 - NIETE ICT (Islamabad): 90,000 students, $10.62/child/year (variable), $13.46/child/year (total)
@@ -72,7 +55,7 @@ YOUR ROLE:
 - Help users understand the dashboard tabs and metrics
 - Answer "what-if" questions based on the data
 - Suggest which tab to visit for specific questions
-- Use real numbers from the context above
+- Use real numbers from the context provided
 
 STYLE:
 - Be conversational but professional
@@ -94,28 +77,102 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
 4. Review Engineering headcount after June (NIETE ICT ends)
 5. Diversify grants - target no funder >25% of total
 """
-        return context
+
+
+@lru_cache(maxsize=32)
+def _build_system_context(
+    current_tab: str,
+    opening_balance: float,
+    projected_surplus: float,
+    total_grants: float,
+    avg_burn: float,
+    runway_months: float,
+) -> str:
+    """Dashboard-state part of the system prompt, reused while unchanged."""
+    return f"""CURRENT CONTEXT:
+- User is viewing: {current_tab}
+- Opening Balance: ${opening_balance:,.0f}
+- Year-End Projected Surplus: ${projected_surplus:,.0f}
+- Total Grants 2026: ${total_grants:,.0f}
+- Average Monthly Burn: ${avg_burn:,.0f}
+- Current Runway: {runway_months:.1f} months
+"""
+
+
+class FinancialChatbot:
+    """
+    AI-powered chatbot that helps users understand the financial dashboard.
+    Context-aware: knows which tab the user is on and their current data.
+    """
+
+    def __init__(self, api_key: Optional[str] = None):
+        """Initialize chatbot with Claude API."""
+        self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        self._client = None
+
+    @property
+    def client(self):
+        """Claude API client, created (and anthropic imported) on first use."""
+        if self._client is None and self.api_key:
+            import anthropic
+            self._client = anthropic.Anthropic(api_key=self.api_key)
+        return self._client
+
+    def get_system_context(self, current_tab: str, dashboard_data: Dict) -> str:
+        """
+        Build context about the dashboard state for Claude.
+        """
+        return _build_system_context(
+            current_tab,
+            dashboard_data.get('opening_balance', 0),
+            dashboard_data.get('projected_surplus', 0),
+            dashboard_data.get('total_grants', 0),
+            dashboard_data.get('avg_burn', 0),
+            dashboard_data.get('runway_months', 0),
+        )
+
+    def get_system_blocks(self, current_tab: str, dashboard_data: Dict) -> List[Dict]:
+        """
+        System prompt as API content blocks: the cached static prompt first,
+        then the current dashboard state.
+        """
+        return [
+            {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": self.get_system_context(current_tab, dashboard_data)},
+        ]
 
     def generate_response(
         self,
         user_message: str,
-        chat_history: List[Dict],
+        chat_history: Iterable[Dict],
         current_tab: str,
         dashboard_data: Dict
-    ) -> str:
+    ) -> Iterator[str]:
         """
-        Generate AI response using Claude API.
+        Stream an AI response from the Claude API, chunk by chunk.
         """
         if not self.client:
-            return "⚠️ Chatbot unavailable: ANTHROPIC_API_KEY not set. Please add it to Railway environment variables."
-
-        # Build message history for Claude
-        messages = []
-        for msg in chat_history[-10:]:  # Keep last 10 messages for context
-            messages.append({
-                "role": msg["role"],
-                "content": msg["content"]
-            })
+            yield "⚠️ Chatbot unavailable: ANTHROPIC_API_KEY not set. Please add it to Railway environment variables."
+            return
+
+        # Build message history for Claude (last 10 messages, no timestamps)
+        messages = [
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in list(chat_history)[-10:]
+        ]
+
+        # A repeated question reuses this session's earlier answer only when
+        # the dashboard context and the preceding turns are the same too
+        response_cache = st.session_state.setdefault("response_cache", OrderedDict())
+        cache_key = (
+            self.get_system_context(current_tab, dashboard_data),
+            tuple((msg["role"], msg["content"]) for msg in messages),
+            user_message.strip().lower(),
+        )
+        if cache_key in response_cache:
+            response_cache.move_to_end(cache_key)
+            yield response_cache[cache_key]
+            return
 
         # Add current user message
         messages.append({
@@ -124,18 +181,24 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
         })
 
         try:
-            # Call Claude API
-            response = self.client.messages.create(
+            # Call Claude API, yielding text as it arrives
+            with self.client.messages.stream(
                 model="claude-sonnet-4-20250514",
                 max_tokens=1024,
-                system=self.get_system_context(current_tab, dashboard_data),
+                system=self.get_system_blocks(current_tab, dashboard_data),
                 messages=messages
-            )
+            ) as stream:
+                chunks = []
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    yield text
 
-            return response.content[0].text
+            response_cache[cache_key] = "".join(chunks)
+            if len(response_cache) > MAX_CACHED_RESPONSES:
+                response_cache.popitem(last=False)
 
         except Exception as e:
-            return f"⚠️ Error: {str(e)}"
+            yield f"⚠️ Error: {str(e)}"
 
     def render_chat_widget(
         self,
@@ -156,7 +219,7 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
         """, unsafe_allow_html=True)
 
         # Check if API key is available
-        if not self.client:
+        if not self.api_key:
             st.sidebar.markdown("""
                 <div role="alert" aria-live="polite" class="chat-message" style="background: #FEF3C7; border-left: 4px solid #F59E0B; padding: 0.75rem;">
                     <strong>⚠️ Chatbot disabled</strong><br>
@@ -167,28 +230,29 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
 
         # Initialize chat history in session state
         if "chat_history" not in st.session_state:
-            st.session_state.chat_history = []
+            st.session_state.chat_history = deque(maxlen=MAX_CHAT_HISTORY)
+        chat_history: Deque[Dict] = st.session_state.chat_history
 
         # Suggested questions based on current tab
         suggestions = self._get_suggested_questions(current_tab)
 
         with st.sidebar.expander("💡 Suggested Questions", expanded=False):
-            for suggestion in suggestions:
-                if st.button(suggestion, key=f"suggest_{hash(suggestion)}", use_container_width=True):
-                    # Add suggestion to chat
-                    st.session_state.chat_history.append({
+            for suggestion, button_key in suggestions:
+                if st.button(suggestion, key=button_key, use_container_width=True):
+                    # Generate response from the history before this question
+                    response = st.sidebar.write_stream(self.generate_response(
+                        suggestion,
+                        chat_history,
+                        current_tab,
+                        dashboard_data
+                    ))
+                    # Add suggestion and response to chat
+                    chat_history.append({
                         "role": "user",
                         "content": suggestion,
                         "timestamp": datetime.now()
                     })
-                    # Generate response
-                    response = self.generate_response(
-                        suggestion,
-                        st.session_state.chat_history[:-1],
-                        current_tab,
-                        dashboard_data
-                    )
-                    st.session_state.chat_history.append({
+                    chat_history.append({
                         "role": "assistant",
                         "content": response,
                         "timestamp": datetime.now()
@@ -196,7 +260,7 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
                     st.rerun()
 
         # Chat history display with accessibility
-        if st.session_state.chat_history:
+        if chat_history:
             # Create accessible chat container
             st.sidebar.markdown("""
                 <div class="chat-container" role="log" aria-label="Chat conversation" aria-live="polite" aria-relevant="additions">
@@ -204,7 +268,7 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
 
             chat_container = st.sidebar.container()
             with chat_container:
-                for idx, msg in enumerate(st.session_state.chat_history[-6:]):  # Show last 6 messages
+                for idx, msg in enumerate(list(chat_history)[-6:]):  # Show last 6 messages
                     role = msg["role"]
                     content = msg["content"]
 
@@ -226,30 +290,28 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
 
             # Clear chat button with accessibility
             if st.sidebar.button("🗑️ Clear Chat", use_container_width=True, help="Clear all chat messages"):
-                st.session_state.chat_history = []
+                chat_history.clear()
                 st.rerun()
 
         # Chat input with accessibility label
         user_input = st.sidebar.chat_input("Ask a question...", key="chat_input")
 
         if user_input:
-            # Add user message
-            st.session_state.chat_history.append({
-                "role": "user",
-                "content": user_input,
-                "timestamp": datetime.now()
-            })
-
-            # Generate AI response
-            response = self.generate_response(
+            # Generate AI response from the history before this question
+            response = st.sidebar.write_stream(self.generate_response(
                 user_input,
-                st.session_state.chat_history[:-1],
+                chat_history,
                 current_tab,
                 dashboard_data
-            )
+            ))
 
-            # Add assistant response
-            st.session_state.chat_history.append({
+            # Add user message and assistant response
+            chat_history.append({
+                "role": "user",
+                "content": user_input,
+                "timestamp": datetime.now()
+            })
+            chat_history.append({
                 "role": "assistant",
                 "content": response,
                 "timestamp": datetime.now()
@@ -257,8 +319,10 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
 
             st.rerun()
 
-    def _get_suggested_questions(self, current_tab: str) -> List[str]:
-        """Get suggested questions based on current tab."""
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_suggested_questions(current_tab: str) -> Tuple[Tuple[str, str], ...]:
+        """Get (question, button key) pairs for the current tab."""
         suggestions = {
             "Dashboard": [
                 "What's our financial health for 2026?",
@@ -285,8 +349,9 @@ RECOMMENDATIONS TO MENTION WHEN RELEVANT:
             ]
         }
 
-        return suggestions.get(current_tab, [
+        questions = suggestions.get(current_tab, [
             "What can this dashboard do?",
             "Explain the budget overview",
             "Where should I start?"
         ])
+        return tuple((q, f"suggest_{current_tab}_{i}") for i, q in enumerate(questions))
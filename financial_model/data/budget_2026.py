@@ -389,6 +389,9 @@ UNIT_ECONOMICS = {
     },
 }
 
+# Total students across all programs (derived from UNIT_ECONOMICS)
+CURRENT_STUDENTS = sum(p["students"] for p in UNIT_ECONOMICS.values())
+
 # Akademos contract details (Page 1)
 AKADEMOS_CONTRACT = {
     "total_pkr": 36000000,
@@ -584,7 +587,7 @@ def calculate_runway(current_cash: float, monthly_burn: float) -> float:
 
 def get_total_students() -> int:
     """Get total students across all programs."""
-    return sum(p["students"] for p in UNIT_ECONOMICS.values())
+    return CURRENT_STUDENTS
 
 
 # Export all constants for easy access
@@ -606,6 +609,7 @@ __all__ = [
     "PROJECTED_SURPLUS",
     "HEADCOUNT",
     "UNIT_ECONOMICS",
+    "CURRENT_STUDENTS",
     "AKADEMOS_CONTRACT",
     "FUNDRAISING_PIPELINE",
     "FUNDRAISING_TARGET",
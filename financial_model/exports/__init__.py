@@ -1,5 +1,17 @@
 """Export functions for financial model data."""
-from .excel_export import export_to_excel
-from .pdf_export import export_to_pdf
+from importlib import import_module
+
+# openpyxl and reportlab are only imported when an exporter is first used
+_EXPORTERS = {
+    'export_to_excel': '.excel_export',
+    'export_to_pdf': '.pdf_export',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTERS:
+        return getattr(import_module(_EXPORTERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['export_to_excel', 'export_to_pdf']
@@ -71,7 +71,7 @@ def export_to_excel(
         ("Net Cash Flow", cashflow_model.get_net_cash_flow()),
         ("Year-End Surplus", cashflow_model.get_year_end_position()),
         ("Exchange Rate (PKR/USD)", custom_assumptions.get('exchange_rate', 283)),
-        ("Runway (Months)", round(cashflow_model.get_year_end_position() / cashflow_model.get_average_monthly_burn(), 1)),
+        ("Runway (Months)", round(cashflow_model.get_runway_months(), 1)),
     ]
 
     for row_idx, (metric, value) in enumerate(metrics, start=5):
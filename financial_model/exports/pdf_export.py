@@ -109,7 +109,7 @@ def export_to_pdf(
 
     opening = custom_assumptions.get('opening_balance', 723248)
     year_end = cashflow_model.get_year_end_position()
-    runway = year_end / cashflow_model.get_average_monthly_burn()
+    runway = cashflow_model.get_runway_months()
 
     summary_text = f"""
     The financial model projects a year-end surplus of <b>${year_end:,.0f}</b> based on
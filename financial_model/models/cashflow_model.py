@@ -5,6 +5,7 @@ All data sourced from budget_2026.py only.
 
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from itertools import accumulate
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -52,25 +53,30 @@ class CashFlowModel:
         self._calculate_positions()
 
     def _calculate_positions(self):
-        """Calculate monthly cash positions."""
-        self.positions = []
-        cumulative = self.opening_balance
-
-        for i, month in enumerate(MONTHS):
-            opening = cumulative
-            month_inflows = self.inflows.get(month, 0)
-            month_outflows = self.expenses.get(month, 0)
-            closing = opening + month_inflows - month_outflows
-            cumulative = closing
-
-            self.positions.append(MonthlyPosition(
+        """Calculate monthly cash positions and the annual aggregates."""
+        self._total_inflows = sum(self.inflows.values())
+        self._total_outflows = sum(self.expenses.values())
+        inflows = [self.inflows.get(m, 0) for m in MONTHS]
+        outflows = [self.expenses.get(m, 0) for m in MONTHS]
+        closings = list(accumulate(
+            (i - o for i, o in zip(inflows, outflows)), initial=self.opening_balance
+        ))
+
+        self.positions = [
+            MonthlyPosition(
                 month=month,
                 opening=opening,
                 inflows=month_inflows,
                 outflows=month_outflows,
                 closing=closing,
-                cumulative=cumulative,
-            ))
+                cumulative=closing,
+            )
+            for month, opening, month_inflows, month_outflows, closing in zip(
+                MONTHS, closings, inflows, outflows, closings[1:]
+            )
+        ]
+
+        self._year_end = self.positions[-1].closing if self.positions else 0
 
     def get_position(self, month: str) -> Optional[MonthlyPosition]:
         """Get cash position for a specific month."""
@@ -81,7 +87,7 @@ class CashFlowModel:
 
     def get_year_end_position(self) -> float:
         """Get projected year-end cash position."""
-        return self.positions[-1].closing if self.positions else 0
+        return self._year_end
 
     def get_minimum_cash_month(self) -> MonthlyPosition:
         """Get the month with minimum cash position."""
@@ -93,19 +99,24 @@ class CashFlowModel:
 
     def get_total_inflows(self) -> float:
         """Get total annual inflows."""
-        return sum(self.inflows.values())
+        return self._total_inflows
 
     def get_total_outflows(self) -> float:
         """Get total annual outflows."""
-        return sum(self.expenses.values())
+        return self._total_outflows
 
     def get_net_cash_flow(self) -> float:
         """Get net cash flow for the year."""
-        return self.get_total_inflows() - self.get_total_outflows()
+        return self._total_inflows - self._total_outflows
 
     def get_average_monthly_burn(self) -> float:
         """Get average monthly burn rate."""
-        return self.get_total_outflows() / 12
+        return self._total_outflows / 12
+
+    def get_runway_months(self) -> float:
+        """Get year-end runway at the average burn rate (inf if nothing is spent)."""
+        burn = self.get_average_monthly_burn()
+        return self._year_end / burn if burn > 0 else float('inf')
 
     def get_inflow_by_category(self) -> Dict[str, Dict[str, float]]:
         """
@@ -82,6 +82,7 @@ class ScenarioModel:
         self.base_inflows = MONTHLY_INFLOWS.copy()
         self.base_expenses = MONTHLY_EXPENSES.copy()
         self.scenarios = {}
+        self.cash_flows = {}
 
     def run_scenario(
         self,
@@ -147,7 +148,6 @@ class ScenarioModel:
         )
 
         min_position = model.get_minimum_cash_month()
-        avg_burn = model.get_average_monthly_burn()
 
         result = ScenarioResult(
             scenario_type=scenario_type,
@@ -157,7 +157,7 @@ class ScenarioModel:
             year_end_surplus=model.get_year_end_position(),
             minimum_cash=min_position.closing,
             minimum_cash_month=min_position.month,
-            runway_months=model.get_year_end_position() / avg_burn if avg_burn > 0 else float('inf'),
+            runway_months=model.get_runway_months(),
             assumptions={
                 "revenue_multiplier": params["revenue_multiplier"],
                 "expense_multiplier": params["expense_multiplier"],
@@ -166,6 +166,7 @@ class ScenarioModel:
         )
 
         self.scenarios[scenario_type] = result
+        self.cash_flows[scenario_type] = {pos.month: pos.closing for pos in model.positions}
         return result
 
     def run_all_scenarios(self) -> Dict[ScenarioType, ScenarioResult]:
@@ -207,32 +208,10 @@ class ScenarioModel:
         if not self.scenarios:
             self.run_all_scenarios()
 
-        cash_flows = {}
-
-        for scenario_type, result in self.scenarios.items():
-            # Re-run the model to get monthly data
-            params = self.SCENARIO_PARAMS.get(scenario_type, self.SCENARIO_PARAMS[ScenarioType.BASE])
-
-            adjusted_inflows = {
-                month: amount * params["revenue_multiplier"] * params.get("grant_probability", 1.0)
-                for month, amount in self.base_inflows.items()
-            }
-            adjusted_expenses = {
-                month: amount * params["expense_multiplier"]
-                for month, amount in self.base_expenses.items()
-            }
-
-            model = CashFlowModel(
-                opening_balance=OPENING_BALANCE,
-                inflows=adjusted_inflows,
-                expenses=adjusted_expenses,
-            )
-
-            cash_flows[result.name] = {
-                pos.month: pos.closing for pos in model.positions
-            }
-
-        return cash_flows
+        return {
+            result.name: self.cash_flows[scenario_type]
+            for scenario_type, result in self.scenarios.items()
+        }
 
     def simulate_grant_loss(self, grant_key: str) -> ScenarioResult:
         """
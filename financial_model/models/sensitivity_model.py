@@ -55,7 +55,8 @@ class SensitivityModel:
         self.base_expenses = MONTHLY_EXPENSES.copy()
         self.base_surplus = PROJECTED_SURPLUS
         self.base_model = CashFlowModel()
-        self.base_runway = self.base_model.get_year_end_position() / self.base_model.get_average_monthly_burn()
+        self.base_runway = self.base_model.get_runway_months()
+        self._break_even_points = {}
 
     def analyze_variable(
         self,
@@ -102,7 +103,7 @@ class SensitivityModel:
             raise ValueError(f"Unknown variable: {variable}")
 
         new_surplus = model.get_year_end_position()
-        new_runway = new_surplus / model.get_average_monthly_burn() if model.get_average_monthly_burn() > 0 else float('inf')
+        new_runway = model.get_runway_months()
 
         return SensitivityResult(
             variable=variable,
@@ -149,18 +150,18 @@ class SensitivityModel:
         """
         results = {}
 
+        # Expenses are untouched, so removing a grant only lowers the base
+        # year-end position by its in-year receipts; no model re-run needed.
+        base_year_end = self.base_model.get_year_end_position()
+        avg_burn = self.base_model.get_average_monthly_burn()
+
         for grant_name, grant_data in GRANT_INCOME.items():
             grant_amount = grant_data["amount"]
 
-            # Simulate removing this grant
-            adjusted_inflows = self.base_inflows.copy()
-            for month, amount in grant_data.get("timing", {}).items():
-                adjusted_inflows[month] = adjusted_inflows.get(month, 0) - amount
-
-            model = CashFlowModel(inflows=adjusted_inflows, expenses=self.base_expenses)
-
-            new_surplus = model.get_year_end_position()
-            avg_burn = model.get_average_monthly_burn()
+            received = sum(
+                amount for month, amount in grant_data.get("timing", {}).items() if month in MONTHS
+            )
+            new_surplus = base_year_end - received
             new_runway = new_surplus / avg_burn if avg_burn > 0 else float('inf')
 
             results[grant_name] = {
@@ -272,26 +273,26 @@ class SensitivityModel:
         Returns:
             Percentage change that results in break-even
         """
-        # Binary search for break-even point
+        # The base data never changes, so each search only runs once
+        key = (variable, tuple(search_range))
+        if key in self._break_even_points:
+            return self._break_even_points[key]
+
+        # Every analyzed variable scales its monthly amounts linearly, so the
+        # year-end surplus is linear in the change: two evaluations locate
+        # the zero crossing, clamped to the search range.
         low, high = search_range
-        tolerance = 0.1
-
-        while high - low > tolerance:
-            mid = (low + high) / 2
-            result = self.analyze_variable(variable, mid)
-
-            if result.new_surplus > 0:
-                if variable == "revenue":
-                    high = mid  # Need to reduce revenue more
-                else:
-                    low = mid   # Need to increase expenses more
-            else:
-                if variable == "revenue":
-                    low = mid
-                else:
-                    high = mid
-
-        return (low + high) / 2
+        surplus_low = self.analyze_variable(variable, low).new_surplus
+        surplus_high = self.analyze_variable(variable, high).new_surplus
+
+        if surplus_high == surplus_low:
+            break_even = low if (surplus_low > 0) == (variable == "revenue") else high
+        else:
+            break_even = low - surplus_low * (high - low) / (surplus_high - surplus_low)
+            break_even = min(max(break_even, low), high)
+
+        self._break_even_points[key] = break_even
+        return break_even
 
     def get_sensitivity_matrix(self) -> Dict[str, Dict[str, float]]:
         """
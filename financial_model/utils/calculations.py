@@ -4,6 +4,7 @@ All calculations use only data from budget_2026.py.
 """
 
 from typing import Dict, List, Optional
+from itertools import accumulate, islice
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -78,14 +79,9 @@ def calculate_cumulative_cash(
     inflows = inflows or MONTHLY_INFLOWS
     expenses = expenses or MONTHLY_EXPENSES
 
-    cumulative = {}
-    cash = opening_balance
-
-    for month in MONTHS:
-        cash = cash + inflows.get(month, 0) - expenses.get(month, 0)
-        cumulative[month] = cash
-
-    return cumulative
+    net = (inflows.get(m, 0) - expenses.get(m, 0) for m in MONTHS)
+    closings = islice(accumulate(net, initial=opening_balance), 1, None)
+    return dict(zip(MONTHS, closings))
 
 
 def calculate_break_even(
@@ -194,9 +190,9 @@ def calculate_growth_funding_gap(
     Returns:
         Dict with funding gap analysis
     """
-    from data.budget_2026 import UNIT_ECONOMICS
+    from data.budget_2026 import CURRENT_STUDENTS
 
-    current_students = sum(p["students"] for p in UNIT_ECONOMICS.values())
+    current_students = CURRENT_STUDENTS
     additional_students = target_students - current_students
     additional_cost_per_year = additional_students * cost_per_student_per_year
 
@@ -0,0 +1,196 @@
+"""
+Display formatting and precomputed dashboard labels.
+All values derive from budget_2026.py only.
+
+Streamlit re-executes app.py on every rerun, but imported modules are
+evaluated once per process, so constant-derived display values live here.
+"""
+
+from functools import lru_cache
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from data.budget_2026 import (
+    AI_BUILT_PRODUCTS,
+    CURRENT_STUDENTS,
+    EXPENSES,
+    GRANT_INCOME,
+    MONTHLY_EXPENSES,
+    MONTHLY_INFLOWS,
+    NON_SALARY_BREAKDOWN,
+    OPENING_BALANCE,
+    PROJECTED_SURPLUS,
+    TOTAL_EXPENSES,
+    TOTAL_INFLOWS,
+    TOTAL_PARTNER_REVENUE,
+    TOTAL_GRANT_INCOME,
+    UNIT_ECONOMICS,
+)
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+# (divisor, format spec, suffix) for plain, thousands and millions
+_CURRENCY_TIERS = (
+    (1, ",.0f", ""),
+    (1_000, ".0f", "K"),
+    (1_000_000, ".1f", "M"),
+)
+
+
+@lru_cache(maxsize=1024)
+def format_currency(value: float, compact: bool = True) -> str:
+    """Format as compact currency."""
+    tier = compact * ((value >= 1_000) + (value >= 1_000_000))
+    divisor, spec, suffix = _CURRENCY_TIERS[tier]
+    return f"${value / divisor:{spec}}{suffix}"
+
+
+# Header status badge for the projected surplus
+_SURPLUS_STATUS = "healthy" if PROJECTED_SURPLUS > 500000 else ("warning" if PROJECTED_SURPLUS > 0 else "danger")
+SURPLUS_STATUS_CLASS = f"status-{_SURPLUS_STATUS}"
+SURPLUS_STATUS_TEXT = {"healthy": "Healthy", "warning": "Caution", "danger": "At Risk"}[_SURPLUS_STATUS]
+
+# One-line budget summary under the header
+BUDGET_FLOW_TEXT = (
+    f"Starting with {format_currency(OPENING_BALANCE)} → Receiving {format_currency(TOTAL_INFLOWS)} → "
+    f"Spending {format_currency(TOTAL_EXPENSES)} → Ending with {format_currency(OPENING_BALANCE + PROJECTED_SURPLUS)}"
+)
+
+# Cash flow chart axis and series, indexed by month number (Jan = 0).
+# The arrays are shared by every session, so they are made read-only.
+CASHFLOW_MONTHS = tuple(MONTHS)
+CASHFLOW_INFLOWS = np.fromiter((MONTHLY_INFLOWS[m] for m in MONTHS), dtype=np.float64, count=12)
+CASHFLOW_EXPENSES = np.fromiter((MONTHLY_EXPENSES[m] for m in MONTHS), dtype=np.float64, count=12)
+CASHFLOW_NET = CASHFLOW_INFLOWS - CASHFLOW_EXPENSES
+for _series in (CASHFLOW_INFLOWS, CASHFLOW_EXPENSES, CASHFLOW_NET):
+    _series.flags.writeable = False
+
+# Average monthly burn; matches CashFlowModel.get_average_monthly_burn()
+MONTHLY_BURN = float(CASHFLOW_EXPENSES.mean())
+
+# Months the projected surplus lasts at that burn, and its story-card tier
+RUNWAY_MONTHS = PROJECTED_SURPLUS / MONTHLY_BURN if MONTHLY_BURN > 0 else 0
+RUNWAY_COLOR = "hero-green" if RUNWAY_MONTHS >= 6 else ("hero-amber" if RUNWAY_MONTHS >= 3 else "hero-red")
+
+# Student-weighted cost per child across the two costed programs
+AVG_COST_PER_CHILD = (
+    UNIT_ECONOMICS["niete_ict"]["students"] * UNIT_ECONOMICS["niete_ict"]["cost_per_child"] +
+    UNIT_ECONOMICS["prevail_rawalpindi"]["students"] * UNIT_ECONOMICS["prevail_rawalpindi"]["cost_per_child"]
+) / CURRENT_STUDENTS if CURRENT_STUDENTS > 0 else 0
+COST_COLOR = "hero-green" if AVG_COST_PER_CHILD <= 5 else ("hero-amber" if AVG_COST_PER_CHILD <= 10 else "hero-red")
+
+# Grant columns
+GRANT_DISPLAY_NAMES = {k: k.replace("_", " ").title() for k in GRANT_INCOME}
+FUNDER_NAMES = np.array(list(GRANT_DISPLAY_NAMES.values()), dtype=object)
+FUNDER_AMOUNTS = np.fromiter((v["amount"] for v in GRANT_INCOME.values()), dtype=np.float64, count=len(GRANT_INCOME))
+FUNDER_PCT = FUNDER_AMOUNTS / TOTAL_GRANT_INCOME * 100
+TOP_GRANT_PCT = float(FUNDER_PCT.max())
+RISK_COLOR = "hero-red" if TOP_GRANT_PCT > 35 else ("hero-amber" if TOP_GRANT_PCT > 25 else "hero-green")
+TOP_FUNDER_TEXT = f"Mulago = {format_currency(GRANT_INCOME['mulago']['amount'])} of {format_currency(TOTAL_GRANT_INCOME)}"
+
+# Concentration: Mulago plus the three Prevail grants
+TOP_2_CONCENTRATION = GRANT_INCOME["mulago"]["amount"] + sum(
+    GRANT_INCOME[k]["amount"] for k in ("prevail_general_ops", "prevail_implementation", "prevail_data_collection")
+)
+TOP_2_PCT = TOP_2_CONCENTRATION / TOTAL_GRANT_INCOME * 100
+TOP_2_TEXT = f"Top 2 funders = **{TOP_2_PCT:.0f}%** of grants"
+
+# Grant summary stats rendered as one HTML block
+GRANT_SUMMARY_HTML = "".join(
+    f'<p class="stat-label">{label}</p><p class="stat-value">{value}</p>'
+    for label, value in (
+        ("Total Grants", format_currency(TOTAL_GRANT_INCOME)),
+        ("Total Partners", format_currency(TOTAL_PARTNER_REVENUE)),
+        ("# of Funders", len(GRANT_INCOME)),
+    )
+)
+
+# Head office vs programs split (the two sum to TOTAL_EXPENSES)
+EXPENSE_SIMPLE_LABELS = ("Head Office", "Programs")
+EXPENSE_SIMPLE_VALUES = (EXPENSES["subtotal_head_office"], EXPENSES["program_operations"])
+
+# Largest non-salary line items
+TOP_NON_SALARY = sorted(NON_SALARY_BREAKDOWN.items(), key=lambda kv: -kv[1])[:3]
+TOP_NON_SALARY_FMT = [(n.replace("_", " ").title(), format_currency(a)) for n, a in TOP_NON_SALARY]
+TOP_NON_SALARY_MD = "  \n".join(f"• {name}: {amount}" for name, amount in TOP_NON_SALARY_FMT)
+
+# Expense and scaling breakdown lines, one Markdown block each
+HEAD_OFFICE_ROWS = (
+    ("Salaries", EXPENSES["salaries_development_teams"]),
+    ("Non-Salary", EXPENSES["non_salary_expenses"]),
+)
+HEAD_OFFICE_PCT = np.array([amount for _, amount in HEAD_OFFICE_ROWS]) / EXPENSES["subtotal_head_office"] * 100
+HEAD_OFFICE_MD = "\n".join(
+    f"- {label}: **{format_currency(amount)}** ({pct:.0f}%)"
+    for (label, amount), pct in zip(HEAD_OFFICE_ROWS, HEAD_OFFICE_PCT)
+)
+PROGRAMS_MD = "\n".join([
+    f"- NIETE ICT: {format_currency(EXPENSES['niete_ict'])} (90K students)",
+    f"- Rawalpindi: {format_currency(EXPENSES['prevail_rawalpindi'])} (37K students)",
+    f"- Other: {format_currency(EXPENSES['programs_other'])}",
+])
+SCALING_MD = "\n".join([
+    "To reach +100K students:",
+    "",
+    f"- At Rawalpindi rate: **{format_currency(100000 * UNIT_ECONOMICS['prevail_rawalpindi']['cost_per_child'])}/year**",
+    f"- At NIETE rate: **{format_currency(100000 * 10.62)}/year**",
+])
+
+# Months where major grants land (> $500K)
+BIG_INFLOW_MONTHS = sorted(((m, v) for m, v in MONTHLY_INFLOWS.items() if v > 500_000), key=lambda x: -x[1])[:3]
+BIG_INFLOW_TEXT = ", ".join(f"**{m}** ({format_currency(v)})" for m, v in BIG_INFLOW_MONTHS)
+
+# Chart inputs: (program, cost_per_child, students) and (name, team_size, traditional)
+EFFICIENCY_PROGRAMS = (
+    ("Rawalpindi", UNIT_ECONOMICS["prevail_rawalpindi"]["cost_per_child"], 37000),
+    ("NIETE ICT (Variable)", UNIT_ECONOMICS["niete_ict"]["cost_per_child"], 90000),
+    ("NIETE ICT (Total)", UNIT_ECONOMICS["niete_ict"]["cost_per_child_total"], 90000),
+)
+AI_TEAM_PRODUCTS = tuple(
+    (prod["name"], prod["team_size"], prod["traditional_team_estimate"])
+    for prod in AI_BUILT_PRODUCTS.values()
+)
+
+
+__all__ = [
+    "format_currency",
+    "SURPLUS_STATUS_CLASS",
+    "SURPLUS_STATUS_TEXT",
+    "BUDGET_FLOW_TEXT",
+    "CASHFLOW_MONTHS",
+    "CASHFLOW_INFLOWS",
+    "CASHFLOW_EXPENSES",
+    "CASHFLOW_NET",
+    "MONTHLY_BURN",
+    "RUNWAY_MONTHS",
+    "RUNWAY_COLOR",
+    "AVG_COST_PER_CHILD",
+    "COST_COLOR",
+    "GRANT_DISPLAY_NAMES",
+    "FUNDER_NAMES",
+    "FUNDER_AMOUNTS",
+    "FUNDER_PCT",
+    "TOP_GRANT_PCT",
+    "RISK_COLOR",
+    "TOP_FUNDER_TEXT",
+    "TOP_2_CONCENTRATION",
+    "TOP_2_PCT",
+    "TOP_2_TEXT",
+    "GRANT_SUMMARY_HTML",
+    "EXPENSE_SIMPLE_LABELS",
+    "EXPENSE_SIMPLE_VALUES",
+    "TOP_NON_SALARY",
+    "TOP_NON_SALARY_FMT",
+    "TOP_NON_SALARY_MD",
+    "HEAD_OFFICE_MD",
+    "PROGRAMS_MD",
+    "SCALING_MD",
+    "BIG_INFLOW_MONTHS",
+    "BIG_INFLOW_TEXT",
+    "EFFICIENCY_PROGRAMS",
+    "AI_TEAM_PRODUCTS",
+]